@@ -0,0 +1,17 @@
+# Generated by Django 3.1.2 on 2026-10-14 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_auto_20201018_1638'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(fields=['date_joined'], name='accounts_user_date_joined_idx'),
+        ),
+    ]
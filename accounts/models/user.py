@@ -3,6 +3,7 @@ Definition of the :class:`~accounts.models.user.User` model.
 """
 
 from django.contrib.auth.models import AbstractUser
+from django.db import models
 
 
 class User(AbstractUser):
@@ -18,4 +19,9 @@ class User(AbstractUser):
 
     """
 
-    pass
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            models.Index(
+                fields=["date_joined"], name="accounts_user_date_joined_idx"
+            )
+        ]
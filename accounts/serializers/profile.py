@@ -4,10 +4,13 @@ class.
 """
 
 from accounts.models import Profile
+from pylabber.serializers import FastRepresentationMixin
 from rest_framework import serializers
 
 
-class ProfileSerializer(serializers.HyperlinkedModelSerializer):
+class ProfileSerializer(
+    FastRepresentationMixin, serializers.HyperlinkedModelSerializer
+):
     """
     `Serializer
     <https://www.django-rest-framework.org/api-guide/serializers/>`_
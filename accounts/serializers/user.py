@@ -4,12 +4,13 @@ Definition of the :class:`~accounts.serializers.user.UserSerializer` class.
 
 from accounts.models.profile import Profile
 from accounts.models.user import User
+from pylabber.serializers import FastRepresentationMixin
 from rest_framework import serializers
 from rest_auth.serializers import UserDetailsSerializer
 from accounts.serializers.profile import ProfileSerializer
 
 
-class UserSerializer(UserDetailsSerializer):
+class UserSerializer(FastRepresentationMixin, UserDetailsSerializer):
     """
     Serializer class for the :class:`~accounts.models.user.User` model.
 
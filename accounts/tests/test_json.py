@@ -0,0 +1,47 @@
+import json
+
+from accounts.tests.utils import LoggedInTestCase
+from datetime import date
+from django.urls import reverse
+from rest_framework import status
+
+
+class CamelCaseJSONTestCase(LoggedInTestCase):
+    """
+    Renders and parses requests through the configured camel-case JSON
+    renderer and parser.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.profile = self.user.profile
+        self.profile.date_of_birth = date(1990, 1, 2)
+        self.profile.institute = "TAU"
+        self.profile.save()
+        self.url = self.profile.get_absolute_url()
+
+    def test_keys_are_camelized(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        content = json.loads(response.content)
+        self.assertEqual(content["firstName"], self.user.first_name)
+        self.assertEqual(content["profile"]["dateOfBirth"], "1990-01-02")
+        self.assertNotIn("first_name", content)
+
+    def test_set_is_rendered_as_list(self):
+        response = self.client.get(reverse("accounts:get_institutions"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content), {"results": ["TAU"]})
+
+    def test_camel_case_keys_are_parsed(self):
+        data = {"profile": {"dateOfBirth": "1991-02-03"}}
+        response = self.client.patch(self.url, data=data, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.profile.refresh_from_db()
+        self.assertEqual(self.profile.date_of_birth, date(1991, 2, 3))
+
+    def test_malformed_json_returns_bad_request(self):
+        response = self.client.patch(
+            self.url, data="{", content_type="application/json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,44 @@
+from accounts.serializers import UserSerializer
+from accounts.tests.utils import LoggedInTestCase
+from datetime import date
+from django.contrib.auth import get_user_model
+from pylabber.serializers import FastRepresentationMixin
+from rest_framework.serializers import Serializer
+from rest_framework.test import APIRequestFactory
+from unittest.mock import patch
+
+User = get_user_model()
+
+
+class FastRepresentationTestCase(LoggedInTestCase):
+    """
+    Compares the output of serializers using
+    :class:`~pylabber.serializers.FastRepresentationMixin` with DRF's own
+    :meth:`Serializer.to_representation`.
+    """
+
+    def setUp(self):
+        super().setUp()
+        user = User.objects.create_user(username="other", first_name="Zvi")
+        user.profile.title = "PHD"
+        user.profile.institute = "TAU"
+        user.profile.date_of_birth = date(1990, 1, 2)
+        user.profile.save()
+        request = APIRequestFactory().get("/")
+        self.context = {"request": request}
+
+    def serialize_users(self):
+        queryset = User.objects.order_by("id")
+        return UserSerializer(queryset, many=True, context=self.context).data
+
+    def test_matches_drf_representation(self):
+        # The nested profile of the logged in user has null fields.
+        self.assertIsNone(self.user.profile.date_of_birth)
+        fast = self.serialize_users()
+        with patch.object(
+            FastRepresentationMixin,
+            "to_representation",
+            Serializer.to_representation,
+        ):
+            drf = self.serialize_users()
+        self.assertEqual(fast, drf)
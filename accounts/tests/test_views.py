@@ -0,0 +1,57 @@
+from accounts.tests.utils import LoggedInTestCase
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+
+User = get_user_model()
+
+
+class ListQueryCountTestCase(LoggedInTestCase):
+    """
+    Makes sure list endpoints execute a constant number of queries regardless
+    of the number of serialized instances.
+    """
+
+    def create_instances(self, start: int, stop: int):
+        for i in range(start, stop):
+            User.objects.create_user(
+                username=f"user{i}", email=f"user{i}@test.test"
+            )
+            Group.objects.create(name=f"group{i}")
+
+    def count_list_queries(self, url_name: str) -> int:
+        url = reverse(url_name)
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return len(context.captured_queries)
+
+    def assert_constant_query_count(self, url_name: str):
+        self.create_instances(0, 1)
+        single = self.count_list_queries(url_name)
+        self.create_instances(1, 6)
+        multiple = self.count_list_queries(url_name)
+        self.assertEqual(single, multiple)
+
+    def test_profile_list_query_count(self):
+        self.assert_constant_query_count("accounts:profile-list")
+
+    def test_user_list_query_count(self):
+        self.assert_constant_query_count("accounts:user-list")
+
+    def test_group_list_query_count(self):
+        self.assert_constant_query_count("accounts:group-list")
+
+
+class InstitutionListTestCase(LoggedInTestCase):
+    def test_get_institutions(self):
+        for i, institute in enumerate(["TAU", "TAU", "HUJI", None]):
+            user = User.objects.create_user(username=f"user{i}")
+            user.profile.institute = institute
+            user.profile.save()
+        response = self.client.get(reverse("accounts:get_institutions"))
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertCountEqual(response.data["results"], ["TAU", "HUJI"])
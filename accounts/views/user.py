@@ -19,16 +19,22 @@ class UserViewSet(DefaultsMixin, viewsets.ModelViewSet):
     """
 
     filter_class = UserFilter
-    queryset = get_user_model().objects.all().order_by("date_joined")
+    queryset = (
+        get_user_model()
+        .objects.select_related("profile")
+        .prefetch_related("laboratory_set")
+        .order_by("date_joined")
+    )
     serializer_class = UserSerializer
 
     @action(detail=False, methods=["get"])
     def get_institutions(self, request):
-        queryset = self.get_queryset()
-        institutions = set(
-            value
-            for value in queryset.values_list("profile__institute", flat=True)
-            if value is not None
+        institutions = (
+            self.get_queryset()
+            .exclude(profile__institute__isnull=True)
+            .order_by()
+            .values_list("profile__institute", flat=True)
+            .distinct()
         )
-        data = {"results": institutions}
+        data = {"results": set(institutions)}
         return Response(data)
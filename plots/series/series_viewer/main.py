@@ -61,7 +61,7 @@ class SeriesViewer:
 arguments = curdoc().session_context.request.arguments
 scan_id = int(arguments.get("scan_id", [-1])[0])
 try:
-    scan = Scan.objects.get(id=scan_id)
+    scan = Scan.objects.select_related("dicom").get(id=scan_id)
 except ObjectDoesNotExist:
     data = np.ones((200, 200, 200))
 else:
@@ -0,0 +1,49 @@
+"""
+Definition of the :class:`~pylabber.serializers.FastRepresentationMixin`
+class.
+"""
+
+from collections import OrderedDict
+from django.utils.functional import cached_property
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+
+
+class FastRepresentationMixin:
+    """
+    Speeds up serialization of many instances by resolving the readable
+    fields' attribute getters and representation methods once per serializer,
+    rather than once per serialized instance. Meant to be mixed into
+    serializers_ used to render long lists, where the same child serializer
+    is reused for every row.
+
+    .. _serializers:
+       https://www.django-rest-framework.org/api-guide/serializers/
+
+    """
+
+    @cached_property
+    def _representation_fields(self) -> tuple:
+        return tuple(
+            (field.field_name, field.get_attribute, field.to_representation)
+            for field in self._readable_fields
+        )
+
+    def to_representation(self, instance) -> OrderedDict:
+        representation = OrderedDict()
+        fields = self._representation_fields
+        for name, get_attribute, to_representation in fields:
+            try:
+                attribute = get_attribute(instance)
+            except SkipField:
+                continue
+            # Mirrors Serializer.to_representation(): related fields may return
+            # a PKOnlyObject, whose pk is what should be checked for None.
+            if isinstance(attribute, PKOnlyObject):
+                value = attribute.pk
+            else:
+                value = attribute
+            representation[name] = (
+                None if value is None else to_representation(attribute)
+            )
+        return representation
@@ -12,8 +12,9 @@ import django_heroku
 import environ
 import os
 
-from django_mri.analysis.mri_interfaces import interfaces
+from django.utils.functional import SimpleLazyObject
 from pathlib import Path
+from pylabber.utils.analysis import load_analysis_interfaces
 
 
 ###############
@@ -31,6 +32,8 @@ env = environ.Env(
     DB_PASSWORD=(str, ""),
     DB_HOST=(str, "localhost"),
     DB_PORT=(int, 5432),
+    DB_CONN_MAX_AGE=(int, 60),
+    DB_DISABLE_SERVER_SIDE_CURSORS=(bool, False),
     RAW_SUBJECT_TABLE_PATH=(str, "subjects.xlsx"),
     QUESTIONNAIRE_DATA_PATH=(str, ""),
     APP_IP=(str, "localhost"),
@@ -133,6 +136,13 @@ DATABASES = {
         "PASSWORD": env("DB_PASSWORD"),
         "HOST": env("DB_HOST"),
         "PORT": env("DB_PORT"),
+        # Keep connections open between requests instead of performing a new
+        # handshake for each one.
+        "CONN_MAX_AGE": env("DB_CONN_MAX_AGE"),
+        # Must be enabled when connecting through a transaction pooler (e.g.
+        # pgbouncer in transaction pooling mode).
+        "DISABLE_SERVER_SIDE_CURSORS": env("DB_DISABLE_SERVER_SIDE_CURSORS"),
+        "OPTIONS": {"application_name": "pylabber"},
     }
 }
 
@@ -282,13 +292,13 @@ REST_FRAMEWORK = {
     "PAGE_SIZE": 20,
     # djangorestframework-camel-case settings
     "DEFAULT_RENDERER_CLASSES": (
-        "djangorestframework_camel_case.render.CamelCaseJSONRenderer",
+        "pylabber.views.renderers.CamelCaseOrjsonRenderer",
         "djangorestframework_camel_case.render.CamelCaseBrowsableAPIRenderer",
     ),
     "DEFAULT_PARSER_CLASSES": (
         "djangorestframework_camel_case.parser.CamelCaseFormParser",
         "djangorestframework_camel_case.parser.CamelCaseMultiPartParser",
-        "djangorestframework_camel_case.parser.CamelCaseJSONParser",
+        "pylabber.views.parsers.CamelCaseOrjsonParser",
     ),
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework.authentication.TokenAuthentication",
@@ -313,7 +323,7 @@ RAW_SUBJECT_TABLE_PATH = env("RAW_SUBJECT_TABLE_PATH")
 QUESTIONNAIRE_DATA_PATH = env("QUESTIONNAIRE_DATA_PATH")
 
 # django_analyses
-ANALYSIS_INTERFACES = interfaces
+ANALYSIS_INTERFACES = SimpleLazyObject(load_analysis_interfaces)
 ANALYSIS_BASE_PATH = os.path.join(MEDIA_ROOT, "analysis")
 EXTRA_INPUT_DEFINITION_SERIALIZERS = {
     "ScanInputDefinition": (
@@ -0,0 +1,21 @@
+"""
+Utilities for the configuration of
+`django_analyses <https://github.com/TheLabbingProject/django_analyses>`_.
+"""
+
+
+def load_analysis_interfaces() -> dict:
+    """
+    Imports the analysis interfaces only when they are first accessed, to
+    avoid importing their heavy dependencies (nipype etc.) along with the
+    settings.
+
+    Returns
+    -------
+    dict
+        Analysis interfaces
+    """
+
+    from django_mri.analysis.mri_interfaces import interfaces
+
+    return interfaces
@@ -0,0 +1,28 @@
+"""
+`orjson <https://github.com/ijl/orjson>`_ based
+`parsers <https://www.django-rest-framework.org/api-guide/parsers/>`_.
+"""
+
+import orjson
+
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import underscoreize
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+
+
+class CamelCaseOrjsonParser(JSONParser):
+    """
+    Parses JSON with orjson and converts the resulting keys to snake case, like
+    djangorestframework-camel-case's *CamelCaseJSONParser*.
+
+    """
+
+    json_underscoreize = api_settings.JSON_UNDERSCOREIZE
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            data = orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+        return underscoreize(data, **self.json_underscoreize)
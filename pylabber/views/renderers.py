@@ -0,0 +1,42 @@
+"""
+`orjson <https://github.com/ijl/orjson>`_ based
+`renderers <https://www.django-rest-framework.org/api-guide/renderers/>`_.
+"""
+
+import orjson
+
+from djangorestframework_camel_case.settings import api_settings
+from djangorestframework_camel_case.util import camelize
+from rest_framework.renderers import JSONRenderer
+
+
+class OrjsonRenderer(JSONRenderer):
+    """
+    JSON renderer backed by orjson. Types orjson does not serialize natively
+    (as well as dates and times, to keep DRF's formatting) are handed to DRF's
+    own encoder.
+
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            options |= orjson.OPT_INDENT_2
+        return orjson.dumps(
+            data, default=self.encoder_class().default, option=options
+        )
+
+
+class CamelCaseOrjsonRenderer(OrjsonRenderer):
+    """
+    Camel-cases the rendered data's keys, like djangorestframework-camel-case's
+    *CamelCaseJSONRenderer*, before rendering it with orjson.
+
+    """
+
+    def render(self, data, *args, **kwargs):
+        data = camelize(data, **api_settings.JSON_UNDERSCOREIZE)
+        return super().render(data, *args, **kwargs)
@@ -3,7 +3,6 @@ Definition of the :class:`SubjectFilter` class.
 """
 
 from django.db.models import Q
-from django_dicom.models.patient import Patient
 from django_filters import rest_framework as filters
 from django_mri.models.scan import Scan
 from research.models.subject import Subject
@@ -53,8 +52,10 @@ class SubjectFilter(filters.FilterSet):
 
     def filter_by_dicom_patient(self, queryset, name, value):
         """
-        Find the subject that represents a particular DICOM
-        :class:`~django_dicom.models.patient.Patient` instance.
+        Find the subjects associated with a particular DICOM
+        :class:`~django_dicom.models.patient.Patient` instance, i.e. all the
+        subjects of the MRI scans created from the patient's series. An
+        unknown patient ID results in an empty queryset.
 
         Parameters
         ----------
@@ -64,18 +65,22 @@ class SubjectFilter(filters.FilterSet):
             The name of the model field to filter on.
         value : int
             DICOM :class:`~django_dicom.models.patient.Patient` ID.
+
+        Returns
+        -------
+        django.db.models.QuerySet
+            The subjects associated with the patient's scans
         """
         if not value:
             return queryset
 
-        dicom_patient = Patient.objects.get(id=value)
-        mri_scans = Scan.objects.filter(
-            dicom__in=dicom_patient.series_set.all()
-        )
-        subject_ids = set(
-            mri_scans.order_by("subject").values_list("subject", flat=True)
+        # Filter on the series' patient foreign key directly and let the
+        # database resolve the subject IDs as a subquery, rather than fetching
+        # the patient and the scans' subject IDs in separate round trips.
+        subject_ids = Scan.objects.filter(dicom__patient_id=value).values(
+            "subject"
         )
-        return queryset.filter(id=subject_ids.pop())
+        return queryset.filter(id__in=subject_ids)
 
     def filter_nullable_charfield(self, queryset, name, value):
         if value == "null":
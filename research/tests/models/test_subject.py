@@ -5,6 +5,8 @@ from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.test import TestCase
 from research.models.choices import DominantHand, Sex, Gender
+from research.models.subject import Subject
+from types import SimpleNamespace
 from ..factories import SubjectFactory
 
 
@@ -114,3 +116,28 @@ class SubjectModelTestCase(TestCase):
 
     def test_get_questionnaire_data(self):
         pass
+
+
+class SubjectQuerySetTestCase(TestCase):
+    def setUp(self):
+        self.patient = SimpleNamespace(
+            uid="ABC123",
+            given_name="Noam",
+            family_name="Aharony",
+            date_of_birth=date(1990, 1, 1),
+            sex="M",
+        )
+
+    def test_from_dicom_patient_creates_subject(self):
+        subject, created = Subject.objects.from_dicom_patient(self.patient)
+        self.assertTrue(created)
+        self.assertEqual(subject.id_number, self.patient.uid)
+        self.assertEqual(subject.first_name, self.patient.given_name)
+        self.assertEqual(subject.last_name, self.patient.family_name)
+
+    def test_from_dicom_patient_matches_by_id_number(self):
+        existing, _ = Subject.objects.from_dicom_patient(self.patient)
+        self.patient.given_name = "Changed"
+        subject, created = Subject.objects.from_dicom_patient(self.patient)
+        self.assertFalse(created)
+        self.assertEqual(subject, existing)
@@ -1,6 +1,10 @@
 from accounts.tests.utils import LoggedInTestCase
 from django.test import TestCase
 from django.urls import reverse
+from django_dicom.models.patient import Patient
+from django_dicom.models.series import Series
+from django_dicom.models.study import Study
+from django_mri.models.scan import Scan
 from rest_framework import status
 from ..factories import SubjectFactory
 
@@ -95,3 +99,58 @@ class LoggedInSubjectViewTestCase(LoggedInTestCase):
         }
         response = self.client.post(url, data=args)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+
+class DicomPatientFilterTestCase(LoggedInTestCase):
+    def setUp(self):
+        self.subject = SubjectFactory()
+        self.subject.save()
+        self.other_subject = SubjectFactory()
+        self.other_subject.save()
+        self.study = Study.objects.create(uid="1.2.3")
+        self.patient = Patient.objects.create(uid="ABC123")
+        super(DicomPatientFilterTestCase, self).setUp()
+
+    def create_scan(self, number: int, subject=None) -> Scan:
+        series = Series.objects.create(
+            uid=f"1.2.3.{number}",
+            study=self.study,
+            patient=self.patient,
+            pixel_spacing=[1, 1],
+            modality="MR",
+        )
+        return Scan.objects.create(dicom=series, subject=subject)
+
+    def get_filtered_ids(self, patient_id: int) -> list:
+        url = reverse("research:subject-list")
+        response = self.client.get(url, {"dicom_patient": patient_id})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [subject["id"] for subject in response.data["results"]]
+
+    def test_filter_by_known_patient(self):
+        self.create_scan(1, subject=self.subject)
+        self.create_scan(2, subject=self.subject)
+        result = self.get_filtered_ids(self.patient.id)
+        self.assertEqual(result, [self.subject.id])
+
+    def test_filter_by_patient_with_several_subjects(self):
+        self.create_scan(1, subject=self.subject)
+        self.create_scan(2, subject=self.other_subject)
+        result = self.get_filtered_ids(self.patient.id)
+        self.assertCountEqual(result, [self.subject.id, self.other_subject.id])
+
+    def test_filter_by_unknown_patient(self):
+        self.create_scan(1, subject=self.subject)
+        result = self.get_filtered_ids(self.patient.id + 1)
+        self.assertEqual(result, [])
+
+    def test_filter_ignores_scans_without_subject(self):
+        self.create_scan(1, subject=self.subject)
+        self.create_scan(2)
+        result = self.get_filtered_ids(self.patient.id)
+        self.assertEqual(result, [self.subject.id])
+
+    def test_filter_by_patient_without_subject(self):
+        self.create_scan(1)
+        result = self.get_filtered_ids(self.patient.id)
+        self.assertEqual(result, [])
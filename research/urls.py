@@ -17,21 +17,23 @@ router.register(
     r"measurement", views.MeasurementDefinitionViewSet, basename="measurement"
 )
 
-urlpatterns = [
-    path(
-        "research/procedure/items/",
-        views.ProcedureViewSet.as_view({"get": "get_items"}),
-        name="get_procedure_items",
-    ),
-    path(
-        "research/event/items/",
-        views.EventViewSet.as_view({"get": "get_items"}),
-        name="get_event_items",
+# Item list routes, as (URL prefix, ViewSet, URL name) tuples.
+ITEMS_ROUTES = (
+    ("procedure", views.ProcedureViewSet, "get_procedure_items"),
+    ("event", views.EventViewSet, "get_event_items"),
+    (
+        "measurement",
+        views.MeasurementDefinitionViewSet,
+        "get_measurement_definition_items",
     ),
+)
+
+urlpatterns = [
     path(
-        "research/measurement/items/",
-        views.MeasurementDefinitionViewSet.as_view({"get": "get_items"}),
-        name="get_measurement_definition_items",
-    ),
-    path("research/", include(router.urls)),
+        f"research/{prefix}/items/",
+        viewset.as_view({"get": "get_items"}),
+        name=name,
+    )
+    for prefix, viewset, name in ITEMS_ROUTES
 ]
+urlpatterns.append(path("research/", include(router.urls)))